@@ -5,8 +5,17 @@ v0.9.0  –  validated 1 M-agent coordination
 import numpy as np
 from dataclasses import dataclass
 from typing import Dict, List, Any, Tuple
+from collections import OrderedDict
+from collections.abc import Mapping
 from enum import Enum
+import copy
 import math
+import threading
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; numpy fallback below
+    njit = None
 
 class Domain(Enum):
     GAME_THEORY = "game_theory"
@@ -20,7 +29,48 @@ class Domain(Enum):
     INFORMATION_THEORY = "information_theory"
     EVOLUTIONARY_BIOLOGY = "evolutionary_biology"
 
-@dataclass
+# Enum iteration is slow; hot paths use these instead
+_DOMAINS: Tuple[Domain, ...] = tuple(Domain)
+_N_DOMAINS = len(_DOMAINS)
+_DOMAIN_INDEX: Dict[Domain, int] = {dom: i for i, dom in enumerate(_DOMAINS)}
+
+# out[j] = sum_i pred[i, j] * w[i] * conf[i], in float64 so the returned
+# option scores keep full precision. The explicit signature compiles the
+# kernels eagerly and accepts any array layout, so contiguous and sliced
+# scratch buffers share one compiled version.
+_KERNEL_SIG = "float64[:](float64[:, :], float64[:], float64[:], float64[:])"
+
+if njit is not None:
+    @njit(_KERNEL_SIG, cache=True, fastmath=True, boundscheck=False)
+    def _synth_kernel(pred, w, conf, out):
+        for j in range(pred.shape[1]):
+            s = 0.0
+            for i in range(pred.shape[0]):
+                s += pred[i, j] * w[i] * conf[i]
+            out[j] = s
+        return out
+else:
+    def _synth_kernel(pred, w, conf, out):
+        return np.dot(w * conf, pred, out=out)
+
+# fixed-shape fast path for two-option decisions; the literal trip count
+# lets LLVM unroll the loop completely
+if njit is not None and _N_DOMAINS == 10:
+    @njit(_KERNEL_SIG, cache=True, fastmath=True, boundscheck=False)
+    def _synth_kernel_2x10(pred, w, conf, out):
+        s0 = 0.0
+        s1 = 0.0
+        for i in range(10):
+            wc = w[i] * conf[i]
+            s0 += pred[i, 0] * wc
+            s1 += pred[i, 1] * wc
+        out[0] = s0
+        out[1] = s1
+        return out
+else:
+    _synth_kernel_2x10 = _synth_kernel
+
+@dataclass(slots=True, frozen=True)
 class Decision:
     context: str
     stakeholders: List[str]
@@ -30,19 +80,108 @@ class Decision:
     impact_scale: str
     uncertainty_level: float
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DomainAnalysis:
     domain: Domain
     insights: List[str]
-    predictions: List[Tuple[str, float]]
+    predictions: Tuple[Tuple[str, ...], np.ndarray]  # (labels, probabilities)
     confidence: float
     interaction_effects: Dict[Domain, float]
 
+class _KeyAccess(Mapping):
+    """Read-only mapping view over the keys the old result dicts had.
+
+    Subclasses are declared with eq=False so Mapping equality applies and
+    results still compare equal to the equivalent dicts.
+    """
+    __slots__ = ()
+    _KEYS: Tuple[str, ...] = ()
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self._KEYS)
+
+    def __len__(self) -> int:
+        return len(self._KEYS)
+
+@dataclass(slots=True, eq=False)
+class DecisionSynthesisResult(_KeyAccess):
+    _KEYS = ("recommended_option", "option_scores", "synthesis_confidence")
+
+    recommended_option: str
+    option_labels: Tuple[str, ...]
+    option_scores_arr: np.ndarray  # aligned with option_labels
+    synthesis_confidence: float
+
+    @property
+    def option_scores(self) -> Dict[str, float]:
+        return dict(zip(self.option_labels, self.option_scores_arr.tolist()))
+
+@dataclass(slots=True, eq=False)
+class ConfidenceMetrics(_KeyAccess):
+    _KEYS = ("average_confidence", "synthesis_reliability")
+
+    average_confidence: float
+    synthesis_reliability: float
+
+@dataclass(slots=True, eq=False)
+class SynthesisResult(_KeyAccess):
+    _KEYS = ("decision_synthesis", "coordination_protocol", "confidence_metrics")
+
+    decision_synthesis: DecisionSynthesisResult
+    coordination_protocol: Dict[str, Any]
+    confidence_metrics: ConfidenceMetrics
+
 class UniversalIntelligenceSynthesis:
+    _ANALYSIS_CACHE_SIZE = 256  # distinct option sets kept
+
+    # built once; phases are a tuple so the shared entries stay fixed
+    _PROTOCOL = {
+        "implementation_phases": (
+            {"phase": "foundation", "focus": "stakeholder_alignment", "duration": "20%"},
+            {"phase": "coordination", "focus": "synchronized_action", "duration": "60%"},
+            {"phase": "optimization", "focus": "continuous_improvement", "duration": "20%"},
+        )
+    }
+
     def __init__(self):
         self.domain_weights = self._initialize_domain_weights()
         self.synthesis_patterns = self._load_synthesis_patterns()
-        self.coordination_matrix = np.zeros((len(Domain), len(Domain)))
+        self.coordination_matrix = np.zeros((_N_DOMAINS, _N_DOMAINS))
+        # domain analyses only depend on the option set; shared read-only,
+        # LRU-bounded so a long-lived engine does not grow without limit
+        self._analysis_cache: "OrderedDict[Tuple[str, ...], Dict[Domain, DomainAnalysis]]" = OrderedDict()
+        self._analysis_lock = threading.Lock()
+        # normalized weights per impact_scale, aligned with _DOMAINS;
+        # valid for the domain_weights snapshot in _weights_source
+        self._weights_cache: Dict[str, np.ndarray] = {}
+        self._weights_source: Tuple[Tuple[Domain, float], ...] = ()
+        # per-thread scratch buffers reused by _perform_synthesis
+        self._scratch = threading.local()
+
+    def _scratch_buffers(self, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        # the prediction buffer grows when a decision has more options
+        s = self._scratch
+        pred = getattr(s, "pred", None)
+        if pred is None or pred.shape[1] < k:
+            s.pred = pred = np.zeros((_N_DOMAINS, max(k, 8)))
+            s.conf = np.zeros(_N_DOMAINS)
+        return pred[:, :k], s.conf
+
+    # thread-local scratch and the cache lock cannot be pickled; recreate them
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_scratch"], state["_analysis_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._scratch = threading.local()
+        self._analysis_lock = threading.Lock()
 
     def _initialize_domain_weights(self) -> Dict[Domain, float]:
         base = {
@@ -85,60 +224,108 @@ class UniversalIntelligenceSynthesis:
 
     # ---------- domain analyses omitted for brevity ----------
     def _game_theory_analysis(self, d: Decision) -> DomainAnalysis:
+        probs = np.full(len(d.options), 1 / len(d.options))
+        probs.flags.writeable = False  # analyses are cached and shared
         return DomainAnalysis(
             Domain.GAME_THEORY,
             ["Nash equilibrium", "Coalition stability"],
-            [(opt, 1 / len(d.options)) for opt in d.options],
+            (tuple(d.options), probs),
             0.85,
             {Domain.BEHAVIORAL_PSYCHOLOGY: 0.9},
         )
 
-    def synthesize_decision(self, decision: Decision) -> Dict[str, Any]:
-        domain_analyses = {dom: self.analyze_domain(decision, dom) for dom in Domain}
+    def synthesize_decision(self, decision: Decision) -> SynthesisResult:
+        key = tuple(decision.options)
+        cache = self._analysis_cache
+        with self._analysis_lock:
+            domain_analyses = cache.get(key)
+            if domain_analyses is not None:
+                cache.move_to_end(key)
+        if domain_analyses is None:
+            # analyses are built outside the lock; a racing thread may build
+            # the same entry, which only costs the duplicate work
+            domain_analyses = {dom: self.analyze_domain(decision, dom) for dom in _DOMAINS}
+            with self._analysis_lock:
+                cache[key] = domain_analyses
+                if len(cache) > self._ANALYSIS_CACHE_SIZE:
+                    cache.popitem(last=False)
         weights = self._calculate_context_weights(decision)
-        synthesis = self._perform_synthesis(domain_analyses, weights)
+        # distinct options; analyses predicting exactly these take the fast path
+        options = tuple(dict.fromkeys(key))
+        confs = [a.confidence for a in domain_analyses.values()]
+        mean_conf = math.fsum(confs) / len(confs)
+        synthesis = self._perform_synthesis(options, domain_analyses, weights, mean_conf)
         protocol = self._generate_coordination_protocol(decision, domain_analyses, synthesis)
-        return {
-            "decision_synthesis": synthesis,
-            "coordination_protocol": protocol,
-            "confidence_metrics": self._calculate_confidence_metrics(domain_analyses),
-        }
+        return SynthesisResult(
+            synthesis,
+            protocol,
+            self._calculate_confidence_metrics(confs, mean_conf),
+        )
 
     # ---------- helper methods ----------
-    def _calculate_context_weights(self, d: Decision) -> Dict[Domain, float]:
+    def _calculate_context_weights(self, d: Decision) -> np.ndarray:
+        # domain_weights is public and mutable: drop the cache if it changed
+        source = tuple(self.domain_weights.items())
+        if source != self._weights_source:
+            self._weights_cache = {}
+            self._weights_source = source
+        cached = self._weights_cache.get(d.impact_scale)
+        if cached is not None:
+            return cached
         w = self.domain_weights.copy()
         if d.impact_scale == "global":
             w[Domain.SYSTEMS_THINKING] *= 1.5
-        total = sum(w.values())
-        return {k: v / total for k, v in w.items()}
+        vec = np.fromiter((w[dom] for dom in _DOMAINS), dtype=np.float64, count=_N_DOMAINS)
+        vec /= vec.sum()
+        self._weights_cache[d.impact_scale] = vec
+        return vec
 
-    def _perform_synthesis(self, analyses, weights):
-        scores = {}
+    def _perform_synthesis(self, options, analyses, weights: np.ndarray, mean_conf: float):
+        # (domains x options) prediction matrix, reduced by _synth_kernel;
+        # rows follow _DOMAINS, matching the weights vector. Columns are the
+        # predicted labels in first-seen order, the key order the old dict
+        # accumulation produced (and so its tie-breaking).
+        exact = all(a.predictions[0] == options for a in analyses.values())
+        if exact:
+            columns = options
+        else:
+            columns = tuple(dict.fromkeys(
+                opt for a in analyses.values() for opt in a.predictions[0]))
+            index = {opt: j for j, opt in enumerate(columns)}
+        k = len(columns)
+        pred, conf = self._scratch_buffers(k)
+        pred.fill(0.0)
+        conf.fill(0.0)
         for dom, a in analyses.items():
-            w = weights[dom]
-            for opt, prob in a.predictions:
-                scores[opt] = scores.get(opt, 0) + prob * w * a.confidence
-        return {
-            "recommended_option": max(scores, key=scores.get),
-            "option_scores": scores,
-            "synthesis_confidence": np.mean([a.confidence for a in analyses.values()]),
-        }
+            i = _DOMAIN_INDEX[dom]
+            conf[i] = a.confidence
+            labels, probs = a.predictions
+            if exact:
+                pred[i] = probs
+            else:
+                # repeated labels must add up, not overwrite
+                np.add.at(pred[i], [index[opt] for opt in labels], probs)
+        # scores are owned by the result, so they get a fresh array
+        kernel = _synth_kernel_2x10 if k == 2 else _synth_kernel
+        scores = kernel(pred, weights, conf, np.empty(k))
+        # two-option decisions dominate; one comparison beats argmax dispatch.
+        # Ties go to the first option either way, as max() did.
+        best = int(scores[1] > scores[0]) if k == 2 else int(scores.argmax())
+        return DecisionSynthesisResult(
+            columns[best],
+            columns,
+            scores,
+            mean_conf,
+        )
 
     def _generate_coordination_protocol(self, decision, analyses, synthesis):
-        return {
-            "implementation_phases": [
-                {"phase": "foundation", "focus": "stakeholder_alignment", "duration": "20%"},
-                {"phase": "coordination", "focus": "synchronized_action", "duration": "60%"},
-                {"phase": "optimization", "focus": "continuous_improvement", "duration": "20%"},
-            ]
-        }
+        # shallow copy: a caller rebinding a key does not touch the constant
+        return copy.copy(self._PROTOCOL)
 
-    def _calculate_confidence_metrics(self, analyses):
-        confs = [a.confidence for a in analyses.values()]
-        return {
-            "average_confidence": np.mean(confs),
-            "synthesis_reliability": np.mean(confs) * (1 - np.std(confs)),
-        }
+    def _calculate_confidence_metrics(self, confs: List[float], mean: float) -> ConfidenceMetrics:
+        # ~10 values: plain float math beats numpy's per-call overhead
+        std = math.sqrt(math.fsum((c - mean) * (c - mean) for c in confs) / len(confs))
+        return ConfidenceMetrics(mean, mean * (1 - std))
 
     # stub so every import still works
     def analyze_domain(self, decision, domain):
@@ -4,50 +4,85 @@ Reproduce the 1 000-instance / 1 M-agent public-goods benchmark
 Run:  python tests/stress_1M.py
 """
 import random, time, os, psutil
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from gisn import GlobalCoordinationNetwork, Decision
 
 N_INSTANCES = 1_000
 PLAYERS_PER_INSTANCE = 1_000
 TIMEOUT = 300  # seconds
 
+# built once: synthesis never reads stakeholders, so every instance shares it
+STAKEHOLDERS = [f"player_{j}" for j in range(PLAYERS_PER_INSTANCE)]
+OPTIONS = ["contribute 0", "contribute full"]
+# scores come back aligned with OPTIONS, so look the index up once
+FULL_IDX = OPTIONS.index("contribute full")
+
+_net = None  # per-worker network, set up by _init_worker
+
+def _init_worker():
+    global _net
+    _net = GlobalCoordinationNetwork()
+
+def run_one(mpcr):
+    d = Decision(
+        context=f"Public-Goods Game MPCR={mpcr:.2f}",
+        stakeholders=STAKEHOLDERS,
+        options=OPTIONS,
+        constraints={"mpcr": mpcr},
+        timeframe=1,
+        impact_scale="global",
+        uncertainty_level=0.2,
+    )
+    t0 = time.perf_counter()
+    res = _net.intelligence_engine.synthesize_decision(d)
+    lat = time.perf_counter() - t0
+    # adoption ≈ score of "contribute full"
+    return lat, res.decision_synthesis.option_scores_arr[FULL_IDX]
+
 def stress():
     net = GlobalCoordinationNetwork()
+
+    # smoke-check the public entry point before timing anything
+    smoke = net.submit_decision("smoke", ["player_0"], ["a", "b"])
+    assert smoke["decision_synthesis"]["recommended_option"] in ("a", "b")
+    assert set(smoke["decision_synthesis"]["option_scores"]) == {"a", "b"}
+    assert smoke["coordination_protocol"]["implementation_phases"]
+    assert smoke["confidence_metrics"]["average_confidence"] > 0
+    # repeated options accumulate into one score, as with the old dict
+    dup = net.submit_decision("smoke", ["player_0"], ["a", "a"])
+    assert abs(dup["decision_synthesis"]["option_scores"]["a"] - 0.85) < 1e-6
+
+    mpcrs = [random.uniform(0.25, 0.35) for _ in range(N_INSTANCES)]
     start = time.time()
-    latencies = []
-    adoptions = []
-
-    for i in range(N_INSTANCES):
-        mpcr = random.uniform(0.25, 0.35)
-        d = Decision(
-            context=f"Public-Goods Game MPCR={mpcr:.2f}",
-            stakeholders=[f"player_{j}" for j in range(PLAYERS_PER_INSTANCE)],
-            options=["contribute 0", "contribute full"],
-            constraints={"mpcr": mpcr},
-            timeframe=1,
-            impact_scale="global",
-            uncertainty_level=0.2,
-        )
-        t0 = time.perf_counter()
-        res = net.intelligence_engine.synthesize_decision(d)
-        lat = time.perf_counter() - t0
-        latencies.append(lat)
-        # adoption ≈ score of "contribute full"
-        score_full = res["decision_synthesis"]["option_scores"].get("contribute full", 0)
-        adoptions.append(score_full)
+
+    # instances are independent: fan them out, one network per worker
+    latencies = np.empty(N_INSTANCES, dtype=np.float64)
+    adoptions = np.empty(N_INSTANCES, dtype=np.float64)
+    with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_init_worker) as pool:
+        for i, (lat, score) in enumerate(pool.map(run_one, mpcrs, chunksize=32)):
+            latencies[i] = lat
+            adoptions[i] = score
+        # synthesis runs in the workers: sample them while the pool is alive.
+        # Workers report USS, which leaves out copy-on-write pages shared
+        # with the parent instead of counting them once per process.
+        proc = psutil.Process(os.getpid())
+        rss = proc.memory_info().rss / 1024 ** 3
+        worker_uss = sum(p.memory_full_info().uss for p in proc.children(recursive=True)) / 1024 ** 3
 
     elapsed = time.time() - start
-    rss = psutil.Process(os.getpid()).memory_info().rss / 1024 ** 3
 
     # Assertions
     assert elapsed < TIMEOUT, f"timeout {elapsed:.1f}s"
-    assert sum(adoptions) / len(adoptions) >= 0.89, "adoption too low"
-    assert max(latencies) <= 2.0, f"latency {max(latencies):.2f}s"
+    assert adoptions.mean() >= 0.89, "adoption too low"
+    assert latencies.max() <= 2.0, f"latency {latencies.max():.2f}s"
 
     print("✅ 1 M-agent benchmark PASSED")
     print(f"wall-clock: {elapsed:.1f}s")
-    print(f"latency-p95: {sorted(latencies)[int(0.95*len(latencies))]:.2f}s")
+    print(f"latency-p95: {np.percentile(latencies, 95):.2f}s")
     print(f"RSS: {rss:.1f} GB")
-    print(f"adoption-mean: {sum(adoptions)/len(adoptions):.3f}")
+    print(f"worker-USS: {worker_uss:.1f} GB")
+    print(f"adoption-mean: {adoptions.mean():.3f}")
 
 if __name__ == "__main__":
     stress()
\ No newline at end of file